@@ -1,5 +1,22 @@
 # Import core functionality
 from . import bytecode
-from .fetcher import fetch, calculate_rate_limit_params
 
-__all__ = ["fetcher", "bytecode", "fetch", "calculate_rate_limit_params"]
+__all__ = ["fetcher", "bytecode", "fetch", "fetch_async", "calculate_rate_limit_params"]
+
+
+def __getattr__(name):
+    # The fetcher module pulls in web3/eth-abi, which are slow to import;
+    # resolve it lazily so importing the package (e.g. for the cache CLI
+    # commands) stays cheap
+    if name in __all__:
+        # importlib rather than "from . import fetcher": the from-import
+        # form re-enters this __getattr__ while the submodule is loading
+        import importlib
+
+        fetcher = importlib.import_module(".fetcher", __name__)
+        globals()["fetcher"] = fetcher
+        globals()["fetch"] = fetcher.fetch
+        globals()["fetch_async"] = fetcher.fetch_async
+        globals()["calculate_rate_limit_params"] = fetcher.calculate_rate_limit_params
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
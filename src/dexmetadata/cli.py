@@ -4,8 +4,6 @@ Command-line interface for dexmetadata package.
 """
 
 import argparse
-import asyncio
-import json
 import os
 import sys
 import time
@@ -16,10 +14,10 @@ from dexmetadata.cache import (
     DEFAULT_CACHE_DIR,
     get_default_cache,
 )
-from dexmetadata.optimize import optimize
 
-from . import fetch
-from .coverage import DEFAULT_RPC_URLS, analyze_coverage_sync
+# The fetch/optimize/coverage modules pull in web3 and eth-abi, which cost
+# hundreds of ms to import; they are imported lazily inside the subcommand
+# handlers so cache-info and cache-clear start fast.
 
 
 def format_size(size_bytes: float) -> str:
@@ -36,6 +34,26 @@ def format_size(size_bytes: float) -> str:
     return f"{size_gb:.2f} GB"
 
 
+def directory_size(path: str) -> int:
+    """Total size in bytes of all files under a directory.
+
+    Uses os.scandir recursively so each entry's size comes from the stat
+    the directory listing already performed, instead of os.walk plus a
+    second os.path.getsize stat per file.
+    """
+    total = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    total += directory_size(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        pass
+    return total
+
+
 def detect_output_format(output_file: str) -> str:
     """Detect output format from file extension."""
     if not output_file:
@@ -49,6 +67,35 @@ def detect_output_format(output_file: str) -> str:
     return "text"
 
 
+# Column order shared by the JSON and CSV output branches of fetch_cli
+POOL_OUTPUT_FIELDS = [
+    "pool_address",
+    "token0_address",
+    "token0_name",
+    "token0_symbol",
+    "token0_decimals",
+    "token1_address",
+    "token1_name",
+    "token1_symbol",
+    "token1_decimals",
+]
+
+
+def pool_to_output_dict(pool) -> dict:
+    """Convert a Pool object to a flat dict for file output."""
+    return {
+        "pool_address": pool.identifier,
+        "token0_address": pool.token0.address,
+        "token0_name": pool.token0.name,
+        "token0_symbol": pool.token0.symbol,
+        "token0_decimals": pool.token0.decimals,
+        "token1_address": pool.token1.address,
+        "token1_name": pool.token1.name,
+        "token1_symbol": pool.token1.symbol,
+        "token1_decimals": pool.token1.decimals,
+    }
+
+
 def fetch_cli(
     pool_addresses: List[str],
     network: str = "base",
@@ -63,6 +110,8 @@ def fetch_cli(
     cache_persist: bool = True,
 ):
     """Fetch metadata for pool addresses."""
+    from . import fetch
+
     start_time = time.time()
 
     # Auto-detect format if not specified
@@ -93,21 +142,10 @@ def fetch_cli(
     if output_file:
         with open(output_file, "w") as f:
             if output_format == "json":
+                import json
+
                 # Convert to dict for JSON serialization
-                pool_dicts = [
-                    {
-                        "pool_address": pool.address,
-                        "token0_address": pool.token0.address,
-                        "token0_name": pool.token0.name,
-                        "token0_symbol": pool.token0.symbol,
-                        "token0_decimals": pool.token0.decimals,
-                        "token1_address": pool.token1.address,
-                        "token1_name": pool.token1.name,
-                        "token1_symbol": pool.token1.symbol,
-                        "token1_decimals": pool.token1.decimals,
-                    }
-                    for pool in pools
-                ]
+                pool_dicts = [pool_to_output_dict(pool) for pool in pools]
                 json.dump(pool_dicts, f, indent=2)
             elif output_format == "csv":
                 import csv
@@ -116,37 +154,24 @@ def fetch_cli(
                     print("No pools to write to CSV")
                     return
 
-                # Convert to dict for CSV writer
-                pool_dicts = [
-                    {
-                        "pool_address": pool.address,
-                        "token0_address": pool.token0.address,
-                        "token0_name": pool.token0.name,
-                        "token0_symbol": pool.token0.symbol,
-                        "token0_decimals": pool.token0.decimals,
-                        "token1_address": pool.token1.address,
-                        "token1_name": pool.token1.name,
-                        "token1_symbol": pool.token1.symbol,
-                        "token1_decimals": pool.token1.decimals,
-                    }
+                # Plain writer with tuple rows; DictWriter would re-index
+                # the dict by fieldname for every row
+                writer = csv.writer(f)
+                writer.writerow(POOL_OUTPUT_FIELDS)
+                writer.writerows(
+                    (
+                        pool.identifier,
+                        pool.token0.address,
+                        pool.token0.name,
+                        pool.token0.symbol,
+                        pool.token0.decimals,
+                        pool.token1.address,
+                        pool.token1.name,
+                        pool.token1.symbol,
+                        pool.token1.decimals,
+                    )
                     for pool in pools
-                ]
-
-                fieldnames = [
-                    "pool_address",
-                    "token0_address",
-                    "token0_name",
-                    "token0_symbol",
-                    "token0_decimals",
-                    "token1_address",
-                    "token1_name",
-                    "token1_symbol",
-                    "token1_decimals",
-                ]
-
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(pool_dicts)
+                )
             else:
                 # Plain text format
                 for pool in pools:
@@ -180,12 +205,7 @@ def cache_info_cli():
         cache_dir_exists = Path(cache_dir).exists()
 
         # Calculate directory size for diskcache
-        total_size = 0
-        if cache_dir_exists:
-            for dirpath, dirnames, filenames in os.walk(cache_dir):
-                for filename in filenames:
-                    file_path = os.path.join(dirpath, filename)
-                    total_size += os.path.getsize(file_path)
+        total_size = directory_size(cache_dir) if cache_dir_exists else 0
 
         print("\n=== DexMetadata Cache Information ===")
         print(f"Cache Directory: {cache_dir}")
@@ -230,6 +250,10 @@ def optimize_cli(
     concurrency: Optional[int] = None,
 ) -> None:
     """Find optimal parameters for fetching pool metadata."""
+    import asyncio
+
+    from .optimize import optimize
+
     asyncio.run(optimize(rpc_url, rate_limit, is_per_second, batch_size, concurrency))
 
 
@@ -409,6 +433,8 @@ def handle_fetch(args):
 
 def handle_coverage(args):
     """Handle the coverage command."""
+    from .coverage import DEFAULT_RPC_URLS, analyze_coverage_sync
+
     # Process custom RPC URLs if provided
     rpc_urls = DEFAULT_RPC_URLS.copy()
     if args.rpc_url:
@@ -8,9 +8,10 @@ across different chains and protocols, based on a sample of real-world swap data
 import asyncio
 import csv
 import logging
+import pickle
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from rich.console import Console
 from rich.progress import (
@@ -39,17 +40,40 @@ DEFAULT_RPC_URLS = {
     "polygon": "https://polygon-rpc.publicnode.com",
 }
 
+# Per-chain (batch_size, max_concurrent_batches) tuning.
+# Chains with expensive state access (e.g. Ethereum mainnet) need smaller
+# batches to avoid out-of-gas errors on public endpoints, while cheaper
+# chains can use larger batches with the default concurrency.
+CHAIN_TUNING: Dict[str, Tuple[int, int]] = {
+    "ethereum": (15, 25),
+    "bnb": (20, 25),
+    "polygon": (20, 25),
+}
+
+# Fallback tuning for chains without an entry in CHAIN_TUNING
+DEFAULT_TUNING: Tuple[int, int] = (30, 25)
+
+
+def _int_defaultdict():
+    """Factory for nested swap counters (module-level so pickling works)."""
+    return defaultdict(int)
+
 
 class SwapSample:
     """Container for swap sample data and analytics."""
 
     def __init__(self, csv_path: Optional[Path] = None):
-        self.pools_by_chain = defaultdict(set)
-        self.pools_by_protocol = defaultdict(set)
+        self.pools_by_chain = defaultdict(list)
+        self.pools_by_protocol = defaultdict(list)
+        # Sibling membership sets for the lists above; lists preserve
+        # insertion order for downstream batching and avoid the per-element
+        # overhead of sets, while the sets keep appends unique in O(1)
+        self._seen_by_chain = defaultdict(set)
+        self._seen_by_protocol = defaultdict(set)
         self.protocol_by_pool = {}
         self.protocol_popularity = defaultdict(int)
         self.chain_popularity = defaultdict(int)
-        self.swaps_by_chain_protocol = defaultdict(lambda: defaultdict(int))
+        self.swaps_by_chain_protocol = defaultdict(_int_defaultdict)
         self.total_swaps = 0
         self.total_swaps_by_chain = defaultdict(int)
 
@@ -57,35 +81,59 @@ class SwapSample:
             self.load_csv(csv_path)
 
     def load_csv(self, csv_path: Path):
-        """Load swap sample data from CSV."""
+        """Load swap sample data from CSV, reusing a cached parse if fresh."""
         if not csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-        with open(csv_path) as f:
-            reader = csv.DictReader(f)
+        # Reparsing the full sample on every run is pure startup cost, so
+        # the parsed state is pickled next to the CSV tagged with its mtime
+        # (same spirit as the hash-named .bin files in bytecode.py)
+        mtime_ns = csv_path.stat().st_mtime_ns
+        cache_path = csv_path.with_suffix(csv_path.suffix + ".cache.pkl")
+        if self._load_parse_cache(cache_path, mtime_ns):
+            return
+
+        with open(csv_path, newline="") as f:
+            # Use csv.reader with positional indexing instead of DictReader,
+            # which allocates a fresh dict per row; column positions are
+            # resolved once from the header
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+
+            dex_col = header.index("dex")
+            pool_id_col = header.index("pool_id")
+            percentage_col = (
+                header.index("percentage") if "percentage" in header else None
+            )
+
             for row in reader:
                 self.total_swaps += 1
 
-                # Extract chain and protocol from dex identifier
-                parts = row["dex"].split("__")
-                if len(parts) < 2:
+                # Extract chain and protocol from dex identifier;
+                # partition stops at the first separator and avoids the
+                # intermediate list + re-join that split required
+                chain, sep, protocol = row[dex_col].partition("__")
+                if not sep:
                     continue
 
-                chain = parts[0]
-                protocol = "__".join(parts[1:])  # Keep full protocol identifier
-
-                # Add pool to collections
-                pool_id = row["pool_id"]
-                self.pools_by_chain[chain].add(pool_id)
-                self.pools_by_protocol[protocol].add(pool_id)
+                # Add pool to collections (deduplicated via the seen sets)
+                pool_id = row[pool_id_col]
+                if pool_id not in self._seen_by_chain[chain]:
+                    self._seen_by_chain[chain].add(pool_id)
+                    self.pools_by_chain[chain].append(pool_id)
+                if pool_id not in self._seen_by_protocol[protocol]:
+                    self._seen_by_protocol[protocol].add(pool_id)
+                    self.pools_by_protocol[protocol].append(pool_id)
                 self.protocol_by_pool[pool_id] = protocol
 
                 # Get volume if available
                 volume = 0
-                if "percentage" in row:
+                if percentage_col is not None:
                     try:
-                        volume = float(row["percentage"])
-                    except (ValueError, TypeError):
+                        volume = float(row[percentage_col])
+                    except (ValueError, IndexError):
                         pass
 
                 # Track swaps per chain and protocol
@@ -97,14 +145,43 @@ class SwapSample:
                 self.chain_popularity[chain] += volume
 
             # Log stats
-            logger.info(f"Loaded {self.total_swaps} swaps from {csv_path}")
-            logger.info(f"Found chains: {list(self.pools_by_chain.keys())}")
-            logger.info(f"Number of chains: {len(self.pools_by_chain)}")
-            logger.info(f"Number of protocols: {len(self.pools_by_protocol)}")
+            logger.info("Loaded %s swaps from %s", self.total_swaps, csv_path)
+            logger.info("Found chains: %s", list(self.pools_by_chain.keys()))
+            logger.info("Number of chains: %s", len(self.pools_by_chain))
+            logger.info("Number of protocols: %s", len(self.pools_by_protocol))
+
+        self._save_parse_cache(cache_path, mtime_ns)
+
+    def _load_parse_cache(self, cache_path: Path, mtime_ns: int) -> bool:
+        """Restore a previously parsed sample if the CSV is unchanged."""
+        if not cache_path.exists():
+            return False
 
-    def get_unique_pools(self) -> Dict[str, Set[str]]:
-        """Get unique pools by chain."""
-        return {chain: pools.copy() for chain, pools in self.pools_by_chain.items()}
+        try:
+            with open(cache_path, "rb") as f:
+                cached_mtime_ns, state = pickle.load(f)
+        except Exception as e:
+            logger.warning("Ignoring unreadable sample cache %s: %s", cache_path, e)
+            return False
+
+        if cached_mtime_ns != mtime_ns:
+            return False
+
+        self.__dict__.update(state)
+        logger.info("Loaded parsed swap sample from cache: %s", cache_path)
+        return True
+
+    def _save_parse_cache(self, cache_path: Path, mtime_ns: int):
+        """Persist the parsed sample next to the CSV, tagged with its mtime."""
+        try:
+            with open(cache_path, "wb") as f:
+                pickle.dump((mtime_ns, self.__dict__), f)
+        except Exception as e:
+            logger.warning("Could not write sample cache %s: %s", cache_path, e)
+
+    def get_unique_pools(self) -> Dict[str, List[str]]:
+        """Get unique pools by chain, in insertion order."""
+        return {chain: list(pools) for chain, pools in self.pools_by_chain.items()}
 
 
 async def analyze_coverage(
@@ -133,6 +210,10 @@ async def analyze_coverage(
     chain_results = {}
     protocol_results = defaultdict(lambda: {"total": 0, "found": 0, "valid": 0})
     failed_by_protocol = defaultdict(list)
+    failed_pool_ids = set()
+
+    # Bind the protocol lookup once; it is hit for every pool in several loops
+    protocol_lookup = sample.protocol_by_pool.get
 
     # Track coverage for swap-based metrics
     swap_coverage_by_chain = defaultdict(int)
@@ -151,8 +232,8 @@ async def analyze_coverage(
         # Group pools by protocol
         protocol_pools = defaultdict(list)
         for pool_id in pool_ids:
-            if pool_id in sample.protocol_by_pool:
-                protocol = sample.protocol_by_pool[pool_id]
+            protocol = protocol_lookup(pool_id)
+            if protocol is not None:
                 protocol_pools[protocol].append(pool_id)
 
         # Select pools to test
@@ -187,32 +268,46 @@ async def analyze_coverage(
         async def process_chain(chain, pool_ids, chain_task_id):
             rpc_url = rpc_urls[chain]
 
-            # Use smaller batch size for Ethereum to avoid out-of-gas errors
-            batch_size = 5 if "ethereum" in rpc_url.lower() else 30
-            if "ethereum" in rpc_url.lower():
+            # Look up per-chain tuning (smaller batches prevent out-of-gas
+            # errors on chains with expensive state access)
+            batch_size, max_concurrent_batches = CHAIN_TUNING.get(
+                chain, DEFAULT_TUNING
+            )
+            if (batch_size, max_concurrent_batches) != DEFAULT_TUNING:
                 logger.info(
-                    f"Using reduced batch size ({batch_size}) for {chain} to prevent 'out of gas' errors"
+                    "Using tuned parameters (batch_size=%s, "
+                    "max_concurrent_batches=%s) for %s",
+                    batch_size,
+                    max_concurrent_batches,
+                    chain,
                 )
 
             # Fetch metadata with explicit cache settings
             try:
                 logger.info(
-                    f"Fetching {len(pool_ids)} pools for {chain} with batch size {batch_size}"
+                    "Fetching %s pools for %s with batch size %s",
+                    len(pool_ids),
+                    chain,
+                    batch_size,
                 )
-                logger.info(f"Cache is enabled: use_cache=True")
 
-                # Get cache stats before fetch
-                from .cache import get_default_cache
+                # Cache-entry accounting issues a COUNT query per call, so
+                # only pay for it when debug logging is enabled; chains now
+                # run concurrently and synchronous log I/O serializes them
+                if logger.isEnabledFor(logging.DEBUG):
+                    from .cache import get_default_cache
 
-                cache = get_default_cache(persist=True)
-                logger.info(f"Cache entries before fetch: {len(cache)}")
+                    cache = get_default_cache(persist=True)
+                    logger.debug("Cache entries before fetch: %s", len(cache))
 
-                # Fetch with cache enabled
-                pools = fetch(
+                # Fetch with cache enabled; run the synchronous fetch in a
+                # worker thread so other chains can proceed concurrently
+                pools = await asyncio.to_thread(
+                    fetch,
                     pool_ids,
                     rpc_url=rpc_url,
                     batch_size=batch_size,
-                    max_concurrent_batches=25,
+                    max_concurrent_batches=max_concurrent_batches,
                     show_progress=False,
                     use_cache=True,
                     cache_persist=True,  # Ensure persistence is enabled
@@ -220,11 +315,8 @@ async def analyze_coverage(
                 )
 
                 # Check cache after fetch
-                logger.info(f"Cache entries after fetch: {len(cache)}")
-
-                # Count results
-                total = len(pool_ids)
-                found = sum(p is not None for p in pools)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Cache entries after fetch: %s", len(cache))
 
                 # Validate pools
                 def is_valid(p):
@@ -232,17 +324,21 @@ async def analyze_coverage(
                         ("is_valid" in p and p["is_valid"]) or "is_valid" not in p
                     )
 
-                valid = sum(is_valid(p) for p in pools)
-
-                # Identify failed pools
-                failed_pools = [
-                    pool_id
-                    for pool_id, pool in zip(pool_ids, pools)
-                    if not is_valid(pool)
-                ]
+                # Count, validate, and collect failures in a single pass
+                total = len(pool_ids)
+                found = valid = 0
+                failed_pools = []
+                for pool_id, pool in zip(pool_ids, pools):
+                    if pool is not None:
+                        found += 1
+                    if is_valid(pool):
+                        valid += 1
+                    else:
+                        failed_pools.append(pool_id)
 
                 # Update progress
                 progress.update(chain_task_id, completed=total)
+                progress.update(overall_task, advance=1)
 
                 return {
                     "chain": chain,
@@ -253,96 +349,28 @@ async def analyze_coverage(
                 }
 
             except Exception as e:
-                logger.error(f"Error analyzing {chain}: {e}")
-                progress.update(chain_task_id, completed=len(pool_ids))
+                logger.error("Error analyzing %s: %s", chain, e)
+                total = len(pool_ids)
+                progress.update(chain_task_id, completed=total)
+                progress.update(overall_task, advance=1)
                 return {
                     "chain": chain,
-                    "total": len(pool_ids),
-                    "found": 0,
-                    "valid": 0,
-                    "failed_pools": pool_ids,
-                }
-
-        # Process chains sequentially
-        results = {}
-        for chain, pool_ids in limited_chains.items():
-            rpc_url = rpc_urls[chain]
-
-            # Use smaller batch size for Ethereum to avoid out-of-gas errors
-            batch_size = 15 if "ethereum" in rpc_url.lower() else 30
-            if "ethereum" in rpc_url.lower():
-                logger.info(
-                    f"Using reduced batch size ({batch_size}) for {chain} to prevent 'out of gas' errors"
-                )
-
-            # Fetch metadata with explicit cache settings
-            try:
-                logger.info(
-                    f"Fetching {len(pool_ids)} pools for {chain} with batch size {batch_size}"
-                )
-                logger.info(f"Cache is enabled: use_cache=True")
-
-                # Get cache stats before fetch
-                from .cache import get_default_cache
-
-                cache = get_default_cache(persist=True)
-                logger.info(f"Cache entries before fetch: {len(cache)}")
-
-                # Fetch with cache enabled
-                pools = fetch(
-                    pool_ids,
-                    rpc_url=rpc_url,
-                    batch_size=batch_size,
-                    max_concurrent_batches=25,
-                    show_progress=False,
-                    use_cache=True,
-                    cache_persist=True,  # Ensure persistence is enabled
-                    format="dict",
-                )
-
-                # Check cache after fetch
-                logger.info(f"Cache entries after fetch: {len(cache)}")
-
-                # Count results
-                total = len(pool_ids)
-                found = sum(p is not None for p in pools)
-
-                # Validate pools
-                def is_valid(p):
-                    return p is not None and (
-                        ("is_valid" in p and p["is_valid"]) or "is_valid" not in p
-                    )
-
-                valid = sum(is_valid(p) for p in pools)
-
-                # Identify failed pools
-                failed_pools = [
-                    pool_id
-                    for pool_id, pool in zip(pool_ids, pools)
-                    if not is_valid(pool)
-                ]
-
-                # Store results
-                results[chain] = {
                     "total": total,
-                    "found": found,
-                    "valid": valid,
-                    "failed_pools": failed_pools,
-                }
-
-                # Update progress
-                progress.update(chain_tasks[chain], completed=total)
-
-            except Exception as e:
-                logger.error(f"Error analyzing {chain}: {e}")
-                results[chain] = {
-                    "total": len(pool_ids),
                     "found": 0,
                     "valid": 0,
                     "failed_pools": pool_ids,
                 }
 
-            progress.update(overall_task, advance=1)
+        # Process all chains concurrently - each chain targets its own RPC
+        # endpoint, so total wall time is bounded by the slowest chain
+        # instead of the sum of all chains
+        chain_reports = await asyncio.gather(
+            *(
+                process_chain(chain, pool_ids, chain_tasks[chain])
+                for chain, pool_ids in limited_chains.items()
+            )
+        )
+        results = {report["chain"]: report for report in chain_reports}
 
     # Process results by chain
     for chain, result in results.items():
@@ -361,13 +389,13 @@ async def analyze_coverage(
         # Map pools to protocols for reporting
         failed_protocols = defaultdict(list)
         for pool_id in failed_pools:
-            if pool_id in sample.protocol_by_pool:
-                protocol = sample.protocol_by_pool[pool_id]
+            protocol = protocol_lookup(pool_id)
+            if protocol is not None:
                 failed_protocols[protocol].append(pool_id)
 
         # Log summary of failed pools
         if failed_protocols:
-            logger.info(f"Failed pools on {chain} by protocol:")
+            logger.info("Failed pools on %s by protocol:", chain)
             for protocol, pools in failed_protocols.items():
                 if protocol in sample.swaps_by_chain_protocol[chain]:
                     swaps = sample.swaps_by_chain_protocol[chain][protocol]
@@ -375,23 +403,33 @@ async def analyze_coverage(
                         swaps / chain_swap_total * 100 if chain_swap_total > 0 else 0
                     )
                     logger.info(
-                        f"  {protocol}: {len(pools)} pools failed ({swaps_pct:.1f}% of chain's swaps)"
+                        "  %s: %s pools failed (%.1f%% of chain's swaps)",
+                        protocol,
+                        len(pools),
+                        swaps_pct,
                     )
 
         # Calculate swap coverage
         swap_coverage = 0.0
 
+        # Bind per-chain loop invariants once; the protocol scan below
+        # re-walks the chain's pool list for every protocol, so failure
+        # membership needs a set rather than a linear list scan
+        chain_pool_ids = limited_chains.get(chain, [])
+        failed_pool_set = set(failed_pools)
+        major_threshold = 0.05 * chain_swap_total
+
         # For each protocol on this chain, calculate how many swaps would be covered
         for protocol, swap_count in sample.swaps_by_chain_protocol[chain].items():
             # Check if this protocol is valid
             protocol_valid = False
-            protocol_is_major = swap_count > 0.05 * chain_swap_total
+            protocol_is_major = swap_count > major_threshold
 
             # Check available pools for this protocol
-            for pool_id in limited_chains.get(chain, []):
+            for pool_id in chain_pool_ids:
                 if (
-                    sample.protocol_by_pool.get(pool_id) == protocol
-                    and pool_id not in failed_pools
+                    protocol_lookup(pool_id) == protocol
+                    and pool_id not in failed_pool_set
                 ):
                     protocol_valid = True
                     break
@@ -399,10 +437,13 @@ async def analyze_coverage(
             # Log diagnostic info for major failed protocols
             if not protocol_valid and protocol_is_major:
                 logger.warning(
-                    f"Major protocol {protocol} on {chain} failed validation"
+                    "Major protocol %s on %s failed validation", protocol, chain
                 )
                 logger.warning(
-                    f"  - Protocol accounts for {swap_count}/{chain_swap_total} swaps ({swap_count / chain_swap_total * 100:.1f}%)"
+                    "  - Protocol accounts for %s/%s swaps (%.1f%%)",
+                    swap_count,
+                    chain_swap_total,
+                    swap_count / chain_swap_total * 100,
                 )
 
             # If protocol is valid, add its swaps to the coverage count
@@ -430,24 +471,26 @@ async def analyze_coverage(
         swap_coverage_by_chain[chain] = swap_coverage
         total_swaps_by_chain[chain] = chain_swap_total
 
-        # Track protocols for failed pools
-        for pool_id in failed_pools:
-            if pool_id in sample.protocol_by_pool:
-                protocol = sample.protocol_by_pool[pool_id]
-                failed_by_protocol[protocol].append(pool_id)
+        # Track protocols for failed pools by bulk-extending from the
+        # per-chain grouping built above instead of reclassifying each pool
+        for protocol, pools in failed_protocols.items():
+            failed_by_protocol[protocol].extend(pools)
+            failed_pool_ids.update(pools)
 
     # Calculate protocol coverage
     for chain, pool_ids in limited_chains.items():
         counted_protocols = set()
         for pool_id in pool_ids:
-            if pool_id in sample.protocol_by_pool:
-                protocol = sample.protocol_by_pool[pool_id]
+            protocol = protocol_lookup(pool_id)
+            if protocol is not None:
                 if protocol not in counted_protocols:
                     protocol_results[protocol]["total"] += 1
                     counted_protocols.add(protocol)
 
-                # Valid pools count towards protocol success
-                if pool_id not in failed_by_protocol[protocol]:
+                # Valid pools count towards protocol success; membership is
+                # checked against the flat set rather than scanning the
+                # per-protocol failure lists
+                if pool_id not in failed_pool_ids:
                     protocol_results[protocol]["found"] += 1
                     protocol_results[protocol]["valid"] += 1
 
@@ -587,6 +630,22 @@ async def run_coverage_analysis(
                 csv_path = path
                 break
 
+        if csv_path is None:
+            # Fall back to the newest raw Dune export, if one is present
+            search_dirs = (
+                Path("."),
+                Path("examples"),
+                Path(__file__).parent.parent.parent / "examples",
+            )
+            dune_csvs = [
+                path
+                for search_dir in search_dirs
+                if search_dir.is_dir()
+                for path in search_dir.glob("dune__*.csv")
+            ]
+            if dune_csvs:
+                csv_path = max(dune_csvs, key=lambda p: p.stat().st_mtime)
+
         if csv_path is None:
             raise FileNotFoundError(
                 "Swap sample CSV not found. Please download it with:"
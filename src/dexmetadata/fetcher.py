@@ -8,6 +8,7 @@ contracts.
 
 import asyncio
 import logging
+import sys
 from typing import Any, Dict, List, Literal, NamedTuple, Optional, Set, Type, Union
 
 from web3.main import AsyncWeb3
@@ -15,12 +16,31 @@ from web3.main import AsyncWeb3
 from .cache import get_default_cache
 from .constants import get_chain_id_from_network
 from .handlers import DefaultPoolFetcher, UniswapV4PoolFetcher, pool_handler_registry
-from .models import Pool
+from .models import Pool, pools_to_columns
 from .progress import ProgressTracker, console
 from .utils import is_valid_metadata
 
 logger = logging.getLogger(__name__)
 
+# Use uvloop for the event loops this module creates when it is installed
+# (pip install dexmetadata[uvloop]); it roughly doubles throughput for
+# I/O-bound workloads on POSIX. Scoped to our own loops rather than
+# asyncio.set_event_loop_policy so a library import never changes the
+# host application's loop choice.
+_new_event_loop = asyncio.new_event_loop
+if sys.platform != "win32":
+    try:
+        import uvloop
+
+        _new_event_loop = uvloop.new_event_loop
+    except ImportError:
+        pass
+
+# Strong references to in-flight background cache writes; the event loop
+# only keeps weak references to tasks, so without this a write could be
+# garbage-collected before it finishes
+_pending_cache_writes: Set[asyncio.Task] = set()
+
 
 class PoolIdentifiers(NamedTuple):
     """Container for categorized pool identifiers."""
@@ -58,9 +78,6 @@ class Web3Provider:
                 await provider_obj.session.close()
             if hasattr(provider_obj, "_session") and provider_obj._session:
                 await provider_obj._session.close()
-            # Handle Web3.py 6.x style provider
-            if hasattr(provider_obj, "http_session") and provider_obj.http_session:
-                await provider_obj.http_session.close()
 
 
 class MetadataFetcher:
@@ -78,14 +95,23 @@ class MetadataFetcher:
         cache_max_pools: int = 50000,  # ~100MB at 2KB per pool
         cache_max_size_mb: Optional[float] = 100.0,  # 100MB cache size
         cache_persist: bool = True,
+        web3: Optional[AsyncWeb3] = None,
+        cache_writes: bool = True,
     ):
         self.pool_identifiers = pool_identifiers
         self.rpc_url = rpc_url
+        # Optional externally managed provider; when set, fetch_metadata
+        # reuses its HTTP session instead of opening a fresh one
+        self.web3 = web3
         self.chain_id = chain_id
         self.batch_size = batch_size
         self.max_concurrent_batches = max_concurrent_batches
         self.show_progress = show_progress
         self.use_cache = use_cache
+        # When False, results are still annotated and cache reads work,
+        # but nothing is written back; the multi-endpoint path uses this
+        # to defer caching until its failover decisions are made
+        self.cache_writes = cache_writes
         self.cache_max_pools = cache_max_pools
         self.cache_max_size_mb = cache_max_size_mb
         self.cache_persist = cache_persist
@@ -98,7 +124,7 @@ class MetadataFetcher:
                 max_size_mb=cache_max_size_mb,
                 persist=cache_persist,
             )
-            logger.info(f"Cache initialized with {len(self.cache)} entries")
+            logger.info("Cache initialized with %s entries", len(self.cache))
 
     def categorize_identifiers(self) -> Dict[Type[DefaultPoolFetcher], List[str]]:
         """
@@ -127,7 +153,8 @@ class MetadataFetcher:
                 for id in normalized_identifiers
             ]
             logger.debug(
-                f"Also checking chain-specific cache keys for chain_id {self.chain_id}"
+                "Also checking chain-specific cache keys for chain_id %s",
+                self.chain_id,
             )
             # Get results with chain-specific keys
             chain_results = self.cache.get_many(chain_specific_keys)
@@ -147,8 +174,23 @@ class MetadataFetcher:
         """
         Update cache with new results.
         """
+        new_cache_entries = self._prepare_cache_entries(results_by_id, cached_keys)
+        if new_cache_entries:
+            self.cache.put_many(new_cache_entries)
+            logger.info("Added %s new entries to cache", len(new_cache_entries))
+
+    def _prepare_cache_entries(
+        self, results_by_id: Dict[str, Dict[str, Any]], cached_keys: Set[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Annotate results and collect the entries missing from the cache.
+
+        Runs synchronously on the caller's path: it mutates the result
+        dicts (is_valid, chain_id), so it must finish before those dicts
+        are handed back. Only the disk write may be deferred.
+        """
         if not self.use_cache or self.cache is None:
-            return
+            return {}
 
         new_cache_entries = {}
         for identifier, result in results_by_id.items():
@@ -173,14 +215,68 @@ class MetadataFetcher:
                 # Log caching of invalid pools for debugging
                 if not is_valid:
                     logger.warning(
-                        f"Caching invalid pool: {normalized_id} with key {cache_key}"
+                        "Caching invalid pool: %s with key %s",
+                        normalized_id,
+                        cache_key,
                     )
 
                 new_cache_entries[cache_key] = result
 
-        if new_cache_entries:
-            self.cache.put_many(new_cache_entries)
-            logger.info(f"Added {len(new_cache_entries)} new entries to cache")
+        return new_cache_entries
+
+    async def _process_handler_types(
+        self,
+        web3_provider: AsyncWeb3,
+        handler_to_identifiers: Dict[Type[DefaultPoolFetcher], List[str]],
+        results_by_id: Dict[str, Dict[str, Any]],
+        batch_semaphore: asyncio.Semaphore,
+        progress_tracker: ProgressTracker,
+    ) -> None:
+        """Run each handler type over its identifiers, collecting results."""
+        for handler_class, identifiers in handler_to_identifiers.items():
+            if not identifiers:
+                continue
+
+            try:
+                # Create appropriate handler instance
+                if handler_class == UniswapV4PoolFetcher:
+                    # UniswapV4PoolFetcher requires chain_id
+                    handler = handler_class(
+                        web3_provider,
+                        self.batch_size,
+                        batch_semaphore,
+                        self.chain_id,
+                        progress_tracker,
+                    )
+                else:
+                    # Default handler initialization
+                    handler = handler_class(
+                        web3_provider,
+                        self.batch_size,
+                        batch_semaphore,
+                        progress_tracker,
+                    )
+
+                # Process pools with this handler
+                handler_results = await handler.process_pools(identifiers)
+
+                # Add results to the results dictionary with appropriate key
+                for result in handler_results:
+                    # Use the unified identifier field as key
+                    key = result.get("identifier", "").lower()
+
+                    if key:
+                        results_by_id[key] = result
+
+            except Exception as e:
+                logger.error(
+                    "Error processing %s pools: %s",
+                    handler_class.PROTOCOL_NAME,
+                    e,
+                )
+                # Update progress tracker to account for failed identifiers
+                if progress_tracker:
+                    progress_tracker.update(len(identifiers))
 
     async def fetch_metadata(self) -> List[Dict[str, Any]]:
         """
@@ -197,7 +293,9 @@ class MetadataFetcher:
 
         # Check cache for existing results
         cached_data = self.get_cached_results(normalized_identifiers)
-        logger.info(f"Cache hits: {len(cached_data)}/{len(self.pool_identifiers)}")
+        logger.info(
+            "Cache hits: %s/%s", len(cached_data), len(self.pool_identifiers)
+        )
 
         # Return immediately if all data is in cache
         if len(cached_data) == len(self.pool_identifiers):
@@ -207,14 +305,23 @@ class MetadataFetcher:
                 )
             return list(cached_data.values())
 
-        # Initialize results and track which identifiers need to be fetched
-        results_by_id = {k: v for k, v in cached_data.items()}
+        # Initialize results and track which identifiers need to be fetched.
+        # All keys in results_by_id are normalized (lowercase): cache keys
+        # are normalized on lookup and handler results are lowered on insert
+        results_by_id = dict(cached_data)
         cached_ids = set(cached_data.keys())
 
-        # Filter out identifiers that are already cached
-        identifiers_to_fetch = [
-            id for id in self.pool_identifiers if id.lower() not in cached_ids
-        ]
+        # Filter out identifiers that are already cached, deduplicating in
+        # the same pass so repeated identifiers only cost one RPC fetch
+        # (results are scattered back per-identifier when ordering below)
+        seen_ids = set(cached_ids)
+        identifiers_to_fetch = []
+        for identifier, normalized_id in zip(
+            self.pool_identifiers, normalized_identifiers
+        ):
+            if normalized_id not in seen_ids:
+                seen_ids.add(normalized_id)
+                identifiers_to_fetch.append(identifier)
 
         # Categorize remaining identifiers by handler type
         handler_to_identifiers = pool_handler_registry.categorize_identifiers(
@@ -236,69 +343,54 @@ class MetadataFetcher:
         # Create semaphore for limiting concurrent batches
         batch_semaphore = asyncio.Semaphore(self.max_concurrent_batches)
 
-        # Use a context manager for the Web3 provider
-        async with Web3Provider(self.rpc_url) as web3_provider:
-            # Process each handler type
-            for handler_class, identifiers in handler_to_identifiers.items():
-                if not identifiers:
-                    continue
-
-                try:
-                    # Create appropriate handler instance
-                    if handler_class == UniswapV4PoolFetcher:
-                        # UniswapV4PoolFetcher requires chain_id
-                        handler = handler_class(
-                            web3_provider,
-                            self.batch_size,
-                            batch_semaphore,
-                            self.chain_id,
-                            progress_tracker,
-                        )
-                    else:
-                        # Default handler initialization
-                        handler = handler_class(
-                            web3_provider,
-                            self.batch_size,
-                            batch_semaphore,
-                            progress_tracker,
-                        )
-
-                    # Process pools with this handler
-                    handler_results = await handler.process_pools(identifiers)
-
-                    # Add results to the results dictionary with appropriate key
-                    for result in handler_results:
-                        # Use the unified identifier field as key
-                        key = result.get("identifier", "").lower()
-
-                        if key:
-                            results_by_id[key] = result
-
-                except Exception as e:
-                    logger.error(
-                        f"Error processing {handler_class.PROTOCOL_NAME} pools: {e}"
-                    )
-                    # Update progress tracker to account for failed identifiers
-                    if progress_tracker:
-                        progress_tracker.update(len(identifiers))
+        if self.web3 is not None:
+            # Reuse the externally managed provider (and its HTTP session)
+            await self._process_handler_types(
+                self.web3,
+                handler_to_identifiers,
+                results_by_id,
+                batch_semaphore,
+                progress_tracker,
+            )
+        else:
+            # Use a context manager for the Web3 provider
+            async with Web3Provider(self.rpc_url) as web3_provider:
+                await self._process_handler_types(
+                    web3_provider,
+                    handler_to_identifiers,
+                    results_by_id,
+                    batch_semaphore,
+                    progress_tracker,
+                )
 
         # Stop progress tracking
         progress_tracker.stop()
 
-        # Update cache with new entries
-        self.update_cache(results_by_id, cached_ids)
+        # Annotate results and pick the entries to cache synchronously —
+        # _prepare_cache_entries mutates the dicts we are about to return,
+        # so it must not race with the caller. Only the disk write goes to
+        # the background; persistent caches hit disk on writes and callers
+        # shouldn't wait on that.
+        new_cache_entries = self._prepare_cache_entries(results_by_id, cached_ids)
+        if new_cache_entries and self.cache_writes:
+            logger.info("Adding %s new entries to cache", len(new_cache_entries))
+            write_task = asyncio.create_task(
+                asyncio.to_thread(self.cache.put_many, new_cache_entries)
+            )
+            _pending_cache_writes.add(write_task)
+            write_task.add_done_callback(_pending_cache_writes.discard)
 
-        # Build final results in original order
+        # Build final results in original order; results_by_id is keyed by
+        # normalized identifier, so a single lookup per input suffices
         ordered_results = []
-        normalized_results = {k.lower(): v for k, v in results_by_id.items()}
-
-        for identifier in self.pool_identifiers:
-            if identifier in results_by_id:
-                ordered_results.append(results_by_id[identifier])
-            elif identifier.lower() in normalized_results:
-                ordered_results.append(normalized_results[identifier.lower()])
+        for identifier, normalized_id in zip(
+            self.pool_identifiers, normalized_identifiers
+        ):
+            result = results_by_id.get(normalized_id)
+            if result is not None:
+                ordered_results.append(result)
             else:
-                logger.warning(f"Pool {identifier} not found in results")
+                logger.warning("Pool %s not found in results", identifier)
 
         # Show summary
         if self.show_progress:
@@ -325,12 +417,13 @@ def fetch(
     batch_size: int = 30,
     show_progress: bool = True,
     max_concurrent_batches: int = 25,
-    format: Literal["dict", "object"] = "object",
+    format: Literal["dict", "object", "columns"] = "object",
     use_cache: bool = True,
     cache_max_pools: int = 50000,  # ~100MB at 2KB per pool
     cache_max_size_mb: Optional[float] = 100.0,  # 100MB cache size
     cache_persist: bool = True,
-) -> List[Union[Dict[str, Any], Pool]]:
+    rpc_urls: Optional[List[str]] = None,
+) -> Union[List[Union[Dict[str, Any], Pool]], Dict[str, List[Any]]]:
     """
     Fetch metadata for DEX pools using deployless multicall with batching.
     Supports both regular pool addresses and Uniswap v4 poolIds.
@@ -343,25 +436,60 @@ def fetch(
         batch_size: Maximum number of identifiers to process in a single call
         show_progress: Whether to show a progress bar (default: True)
         max_concurrent_batches: Maximum number of batches to process concurrently (default: 25)
-        format: Output format - either "dict" or "object" (default: "object")
+        format: Output format - "dict", "object", or "columns" for a
+            dict of column lists suited to bulk/dataframe consumers
+            (default: "object")
         use_cache: Whether to use cache (default: True)
         cache_max_pools: Maximum number of pools to cache (default: 10000)
         cache_max_size_mb: Maximum cache size in MB (overrides cache_max_pools if provided)
         cache_persist: Whether to persist cache to disk (default: True)
+        rpc_urls: Several RPC URLs serving the same chain; when given,
+            the workload is spread across them and overrides rpc_url
 
     Returns:
-        List of pool metadata dictionaries or Pool objects
+        List of pool metadata dictionaries or Pool objects, or a dict
+        of column lists when format="columns"
     """
     # Set up RPC URL if not provided
     if rpc_url is None and network is not None:
         rpc_url = f"https://{network}-rpc.publicnode.com"
 
+    # Spread the workload across several endpoints if requested
+    if rpc_urls:
+        coroutine = fetch_async(
+            pool_identifiers,
+            rpc_url=rpc_url,
+            network=network,
+            chain_id=chain_id,
+            batch_size=batch_size,
+            show_progress=show_progress,
+            max_concurrent_batches=max_concurrent_batches,
+            format=format,
+            use_cache=use_cache,
+            cache_max_pools=cache_max_pools,
+            cache_max_size_mb=cache_max_size_mb,
+            cache_persist=cache_persist,
+            rpc_urls=rpc_urls,
+        )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return _run_in_new_event_loop(coroutine)
+
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor() as pool:
+            return pool.submit(_run_in_new_event_loop, coroutine).result()
+
     # Try to run asynchronously
     try:
         # Check if we're already in an event loop
         asyncio.get_running_loop()
 
-        # We're in an async context, need to use thread
+        # We're in an async context but must return a list, so the work
+        # runs in a throwaway thread with its own event loop. Async
+        # callers should prefer `await fetch_async(...)`, which schedules
+        # on the running loop directly and skips this thread entirely.
         import concurrent.futures
 
         with concurrent.futures.ThreadPoolExecutor() as pool:
@@ -382,8 +510,8 @@ def fetch(
             )
             return future.result()
     except RuntimeError:
-        # Not in an event loop, can use asyncio.run directly
-        return asyncio.run(
+        # Not in an event loop, run on a fresh one directly
+        return _run_in_new_event_loop(
             run_fetch_async(
                 pool_identifiers,
                 rpc_url,
@@ -401,6 +529,63 @@ def fetch(
         )
 
 
+async def fetch_async(
+    pool_identifiers: List[str],
+    rpc_url: str = None,
+    network: str = "base",
+    chain_id: Optional[int] = None,
+    batch_size: int = 30,
+    show_progress: bool = True,
+    max_concurrent_batches: int = 25,
+    format: Literal["dict", "object", "columns"] = "object",
+    use_cache: bool = True,
+    cache_max_pools: int = 50000,
+    cache_max_size_mb: Optional[float] = 100.0,
+    cache_persist: bool = True,
+    rpc_urls: Optional[List[str]] = None,
+) -> Union[List[Union[Dict[str, Any], Pool]], Dict[str, List[Any]]]:
+    """
+    Async variant of :func:`fetch`.
+
+    Runs on the caller's event loop, so async applications avoid the
+    worker thread and second event loop that the sync entry point needs
+    when called from async code. Accepts the same arguments as fetch().
+    """
+    # Set up RPC URL if not provided
+    if rpc_url is None and network is not None:
+        rpc_url = f"https://{network}-rpc.publicnode.com"
+
+    if rpc_urls:
+        return await _run_fetch_multi_rpc(
+            pool_identifiers,
+            list(rpc_urls),
+            network,
+            chain_id,
+            batch_size,
+            max_concurrent_batches,
+            format,
+            use_cache,
+            cache_max_pools,
+            cache_max_size_mb,
+            cache_persist,
+        )
+
+    return await run_fetch_async(
+        pool_identifiers,
+        rpc_url,
+        network,
+        chain_id,
+        batch_size,
+        show_progress,
+        max_concurrent_batches,
+        format,
+        use_cache,
+        cache_max_pools,
+        cache_max_size_mb,
+        cache_persist,
+    )
+
+
 async def run_fetch_async(
     pool_identifiers: List[str],
     rpc_url: str,
@@ -409,90 +594,255 @@ async def run_fetch_async(
     batch_size: int,
     show_progress: bool,
     max_concurrent_batches: int,
-    format: Literal["dict", "object"],
+    format: Literal["dict", "object", "columns"],
     use_cache: bool,
     cache_max_pools: int,
     cache_max_size_mb: Optional[float],
     cache_persist: bool,
-) -> List[Union[Dict[str, Any], Pool]]:
+    *,
+    cache_writes: bool = True,
+) -> Union[List[Union[Dict[str, Any], Pool]], Dict[str, List[Any]]]:
     """Run the fetch operation asynchronously."""
-    # Determine chain ID if not provided
-    if chain_id is None:
-        # Try to get from network name or RPC URL
-        chain_id = get_chain_id_from_network(network, rpc_url)
-
+    # Open a single provider for the whole run; chain-id detection and
+    # the fetcher share one HTTP session instead of opening one each
+    async with Web3Provider(rpc_url) as web3:
+        # Determine chain ID if not provided
         if chain_id is None:
-            # Try to get from web3 provider
-            try:
-                async with Web3Provider(rpc_url) as web3:
+            # Try to get from network name or RPC URL
+            chain_id = get_chain_id_from_network(network, rpc_url)
+
+            if chain_id is None:
+                # Try to get from web3 provider
+                try:
                     chain_id = await web3.eth.chain_id
-                    logger.info(f"Detected chain ID: {chain_id}")
-            except Exception as e:
-                logger.error(f"Could not determine chain ID: {e}")
-                raise ValueError(
-                    f"Could not determine chain ID for network '{network}'. "
-                    "Please provide chain_id parameter or ensure network name is valid."
-                )
+                    logger.info("Detected chain ID: %s", chain_id)
+                except Exception as e:
+                    logger.error("Could not determine chain ID: %s", e)
+                    raise ValueError(
+                        f"Could not determine chain ID for network '{network}'. "
+                        "Please provide chain_id parameter or ensure network name is valid."
+                    )
 
-    # Create and run the fetcher
-    fetcher = MetadataFetcher(
-        pool_identifiers=pool_identifiers,
-        rpc_url=rpc_url,
-        chain_id=chain_id,
-        batch_size=batch_size,
-        max_concurrent_batches=max_concurrent_batches,
-        show_progress=show_progress,
-        use_cache=use_cache,
-        cache_max_pools=cache_max_pools,
-        cache_max_size_mb=cache_max_size_mb,
-        cache_persist=cache_persist,
-    )
+        # Create and run the fetcher
+        fetcher = MetadataFetcher(
+            pool_identifiers=pool_identifiers,
+            rpc_url=rpc_url,
+            chain_id=chain_id,
+            batch_size=batch_size,
+            max_concurrent_batches=max_concurrent_batches,
+            show_progress=show_progress,
+            use_cache=use_cache,
+            cache_max_pools=cache_max_pools,
+            cache_max_size_mb=cache_max_size_mb,
+            cache_persist=cache_persist,
+            web3=web3,
+            cache_writes=cache_writes,
+        )
 
-    # Fetch the metadata
-    results = await fetcher.fetch_metadata()
+        # Fetch the metadata
+        results = await fetcher.fetch_metadata()
 
-    # Convert to Pool objects if requested
+    # Convert to the requested output shape
     if format == "object":
         return [Pool.from_dict(data) for data in results]
+    if format == "columns":
+        return pools_to_columns(results)
     return results
 
 
-def run_fetch_in_new_event_loop(
+async def _run_fetch_multi_rpc(
     pool_identifiers: List[str],
-    rpc_url: str,
+    rpc_urls: List[str],
     network: str,
     chain_id: Optional[int],
     batch_size: int,
-    show_progress: bool,
     max_concurrent_batches: int,
-    format: Literal["dict", "object"],
+    format: Literal["dict", "object", "columns"],
     use_cache: bool,
     cache_max_pools: int,
     cache_max_size_mb: Optional[float],
     cache_persist: bool,
-) -> List[Union[Dict[str, Any], Pool]]:
-    """Run fetch_async in a new event loop."""
-    # Create a new event loop
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+) -> Union[List[Union[Dict[str, Any], Pool]], Dict[str, List[Any]]]:
+    """
+    Distribute a fetch across several RPC endpoints serving the same chain.
+
+    Identifiers are striped round-robin across the endpoints and fetched
+    concurrently, so throughput scales with endpoint count instead of
+    being capped by a single provider's rate limit. A slice is retried
+    once on the next endpoint when its endpoint fails outright or when
+    every pool in it comes back invalid, which is how swallowed
+    transport errors surface. Sub-fetches never write the cache; the
+    merged results are cached once after all failover decisions are
+    made, so a dead endpoint's placeholders cannot poison the cache or
+    be served back to their own retry. Progress bars are disabled for
+    the sub-fetches since several would compete for the terminal.
+    """
+    num_endpoints = len(rpc_urls)
+    slices = [pool_identifiers[i::num_endpoints] for i in range(num_endpoints)]
+
+    def slice_all_invalid(results):
+        # Transport errors rarely surface as exceptions by the time a
+        # slice completes: make_eth_call swallows them into empty
+        # responses, which decode into invalid-pool placeholders. A slice
+        # that came back entirely invalid is therefore the usual signature
+        # of a dead endpoint, not of uniformly bad input.
+        if not results:
+            return False
+        return all(not item.get("is_valid", False) for item in results)
+
+    async def fetch_slice(identifiers, endpoint_index):
+        if not identifiers:
+            return []
 
-    try:
-        return loop.run_until_complete(
-            run_fetch_async(
-                pool_identifiers,
-                rpc_url,
+        rpc_url = rpc_urls[endpoint_index]
+        fallback_url = rpc_urls[(endpoint_index + 1) % num_endpoints]
+
+        # Slices are fetched row-wise with cache writes disabled: they are
+        # merged by identifier and cached centrally after the failover
+        # decision. The fallback also skips cache reads, so an all-invalid
+        # first attempt can never be handed its own placeholders back
+        async def fetch_from(url, read_cache=True):
+            return await run_fetch_async(
+                identifiers,
+                url,
                 network,
                 chain_id,
                 batch_size,
-                show_progress,
+                False,  # show_progress
                 max_concurrent_batches,
-                format,
-                use_cache,
+                "dict",
+                use_cache and read_cache,
                 cache_max_pools,
                 cache_max_size_mb,
                 cache_persist,
+                cache_writes=False,
+            )
+
+        try:
+            results = await fetch_from(rpc_url)
+        except Exception as e:
+            if fallback_url == rpc_url:
+                raise
+            logger.warning(
+                "RPC endpoint %s failed (%s); retrying slice on %s",
+                rpc_url,
+                e,
+                fallback_url,
+            )
+            return await fetch_from(fallback_url, read_cache=False)
+
+        if fallback_url != rpc_url and slice_all_invalid(results):
+            logger.warning(
+                "RPC endpoint %s returned no valid metadata for its %s pools; "
+                "retrying slice on %s",
+                rpc_url,
+                len(identifiers),
+                fallback_url,
+            )
+            try:
+                retry_results = await fetch_from(fallback_url, read_cache=False)
+            except Exception as e:
+                logger.warning(
+                    "Fallback endpoint %s failed (%s); keeping original results",
+                    fallback_url,
+                    e,
+                )
+                return results
+            if not slice_all_invalid(retry_results):
+                return retry_results
+
+        return results
+
+    slice_results = await asyncio.gather(
+        *(fetch_slice(identifiers, i) for i, identifiers in enumerate(slices))
+    )
+
+    # Merge slices back into the caller's order by identifier
+    results_by_id = {}
+    for results in slice_results:
+        for item in results:
+            results_by_id[item.get("identifier", "").lower()] = item
+
+    ordered_results = []
+    for identifier in pool_identifiers:
+        item = results_by_id.get(identifier.lower())
+        if item is not None:
+            ordered_results.append(item)
+        else:
+            logger.warning("Pool %s not found in results", identifier)
+
+    # Cache the merged results only now that the failover decisions are
+    # made. Annotation must run before the results are returned (see
+    # fetch_metadata); only the put_many disk write goes to the
+    # background. Entries that were served from cache are rewritten,
+    # which is an idempotent update.
+    if use_cache and ordered_results:
+        writer = MetadataFetcher(
+            pool_identifiers=pool_identifiers,
+            rpc_url=rpc_urls[0],
+            chain_id=chain_id,
+            use_cache=True,
+            cache_max_pools=cache_max_pools,
+            cache_max_size_mb=cache_max_size_mb,
+            cache_persist=cache_persist,
+        )
+        new_cache_entries = writer._prepare_cache_entries(results_by_id, set())
+        if new_cache_entries:
+            logger.info("Adding %s new entries to cache", len(new_cache_entries))
+            write_task = asyncio.create_task(
+                asyncio.to_thread(writer.cache.put_many, new_cache_entries)
             )
+            _pending_cache_writes.add(write_task)
+            write_task.add_done_callback(_pending_cache_writes.discard)
+
+    # Convert to the requested output shape
+    if format == "object":
+        return [Pool.from_dict(data) for data in ordered_results]
+    if format == "columns":
+        return pools_to_columns(ordered_results)
+    return ordered_results
+
+
+def run_fetch_in_new_event_loop(
+    pool_identifiers: List[str],
+    rpc_url: str,
+    network: str,
+    chain_id: Optional[int],
+    batch_size: int,
+    show_progress: bool,
+    max_concurrent_batches: int,
+    format: Literal["dict", "object", "columns"],
+    use_cache: bool,
+    cache_max_pools: int,
+    cache_max_size_mb: Optional[float],
+    cache_persist: bool,
+) -> Union[List[Union[Dict[str, Any], Pool]], Dict[str, List[Any]]]:
+    """Run fetch_async in a new event loop."""
+    return _run_in_new_event_loop(
+        run_fetch_async(
+            pool_identifiers,
+            rpc_url,
+            network,
+            chain_id,
+            batch_size,
+            show_progress,
+            max_concurrent_batches,
+            format,
+            use_cache,
+            cache_max_pools,
+            cache_max_size_mb,
+            cache_persist,
         )
+    )
+
+
+def _run_in_new_event_loop(coroutine):
+    """Run a coroutine to completion on a fresh event loop (uvloop when available)."""
+    loop = _new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    try:
+        return loop.run_until_complete(coroutine)
     finally:
         # Clean up any remaining tasks
         try:
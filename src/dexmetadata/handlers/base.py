@@ -18,6 +18,13 @@ class PoolFetcher:
     PROTOCOL_NAME = "base"
     SUPPORTS_TYPE_CHECK = None  # Function to check if handler supports an identifier
 
+    # Upper bound on eth_call payloads coalesced into a single JSON-RPC
+    # batch request; kept modest since some public endpoints cap batch
+    # sizes. The effective group size and group concurrency are derived
+    # from it in __init__ so that coalescing never raises the number of
+    # in-flight calls above max_concurrent_batches
+    RPC_BATCH_SIZE = 10
+
     def __init__(
         self,
         web3_provider: AsyncWeb3,
@@ -33,6 +40,18 @@ class PoolFetcher:
         # This ensures we respect the user's concurrency settings
         connection_limit = batch_semaphore._value
         self.connection_semaphore = asyncio.Semaphore(connection_limit)
+        # Probe batch support once; batch_requests exists on AsyncWeb3
+        # since web3 7.x (our floor), but stubbed or exotic providers may
+        # lack it and should go straight to individual calls
+        self._supports_rpc_batch = hasattr(web3_provider, "batch_requests")
+        # max_concurrent_batches budgets in-flight eth_calls (providers
+        # count every call inside a JSON-RPC batch against the rate
+        # limit), so group concurrency is scaled down to keep
+        # group_size * concurrent groups within that budget
+        self._group_size = max(1, min(self.RPC_BATCH_SIZE, connection_limit))
+        self._group_semaphore = asyncio.Semaphore(
+            max(1, connection_limit // self._group_size)
+        )
 
     @classmethod
     def supports(cls, identifier: str) -> bool:
@@ -47,8 +66,9 @@ class PoolFetcher:
 
         This is the default implementation that works for most handlers:
         1. Creates batches from the pool identifiers
-        2. Processes each batch concurrently
-        3. Collects and returns the results
+        2. Coalesces batches into JSON-RPC batch requests and sends them
+           concurrently
+        3. Collects and returns the decoded results
 
         Override if needed for special protocols.
         """
@@ -64,18 +84,92 @@ class PoolFetcher:
             for i in range(0, len(pool_identifiers), self.batch_size)
         ]
 
-        # Process all batches concurrently
-        tasks = [self.process_batch(batch) for batch in batches]
-        batch_results = await asyncio.gather(*tasks)
+        # Group batches so several eth_call payloads share one HTTP
+        # round-trip, then process all groups concurrently
+        groups = [
+            batches[i : i + self._group_size]
+            for i in range(0, len(batches), self._group_size)
+        ]
+        group_results = await asyncio.gather(
+            *(self.process_batch_group(group) for group in groups)
+        )
 
         # Flatten results
         all_results = []
-        for batch in batch_results:
-            all_results.extend(batch)
+        for results in group_results:
+            all_results.extend(results)
 
         # Post-processing hook (can be overridden by subclasses)
         return await self.post_process_pools(all_results)
 
+    async def process_batch_group(
+        self, batches: List[List[str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Process a group of batches with a single JSON-RPC batch request.
+
+        One group permit stands for up to _group_size in-flight eth_calls,
+        which is how the max_concurrent_batches budget stays intact.
+        """
+        async with self._group_semaphore:
+            # Build the deployless call payload for each batch; a batch
+            # whose payload cannot be encoded is treated like an empty
+            # response so the rest of the group still goes out
+            payloads = []
+            for batch in batches:
+                try:
+                    payloads.append(self.build_batch_payload(batch))
+                except Exception as e:
+                    logger.error(f"Error encoding batch payload: {e}")
+                    payloads.append(None)
+
+            responses = await self.execute_rpc_batch(
+                [data for data in payloads if data is not None]
+            )
+            response_iter = iter(responses)
+
+            results = []
+            for batch, data in zip(batches, payloads):
+                result = b"" if data is None else next(response_iter)
+                results.extend(self.decode_batch(batch, result))
+                if self.progress_tracker:
+                    self.progress_tracker.update(len(batch))
+            return results
+
+    async def execute_rpc_batch(self, payloads: List[str]) -> List[bytes]:
+        """
+        Execute several eth_call payloads in one JSON-RPC batch request.
+
+        Falls back to individual calls if the endpoint rejects the batch
+        (some public RPCs disallow or cap batched requests).
+        """
+        if not payloads:
+            return []
+
+        if len(payloads) > 1 and self._supports_rpc_batch:
+            try:
+                async with self.connection_semaphore:
+                    async with self.web3.batch_requests() as batch:
+                        for data in payloads:
+                            batch.add(self.web3.eth.call({"data": data}))
+                        responses = await batch.async_execute()
+                # Some public endpoints silently drop requests from a
+                # batch; a short response set would misalign results with
+                # their batches downstream, so treat it as a batch failure
+                if len(responses) != len(payloads):
+                    raise ValueError(
+                        f"endpoint returned {len(responses)} responses "
+                        f"for {len(payloads)} calls"
+                    )
+                return [bytes(response) for response in responses]
+            except Exception as e:
+                logger.warning(
+                    f"JSON-RPC batch of {len(payloads)} calls failed, "
+                    f"retrying individually: {e}"
+                )
+
+        return [await self.make_eth_call(data) for data in payloads]
+
     async def pre_process_pools(self, pool_identifiers: List[str]) -> None:
         """
         Pre-process pools before batch processing.
@@ -96,9 +190,19 @@ class PoolFetcher:
         """
         return results
 
-    async def process_batch(self, batch_identifiers: List[str]) -> List[Dict[str, Any]]:
+    def build_batch_payload(self, batch_identifiers: List[str]) -> str:
+        """
+        Build the deployless multicall payload for a batch of pools.
+
+        This method must be implemented by subclasses with protocol-specific logic.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def decode_batch(
+        self, batch_identifiers: List[str], result: bytes
+    ) -> List[Dict[str, Any]]:
         """
-        Process a single batch of pools.
+        Decode the eth_call response for a batch of pools.
 
         This method must be implemented by subclasses with protocol-specific logic.
         """
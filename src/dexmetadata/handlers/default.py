@@ -4,6 +4,7 @@ Handler for regular DEX pools (non-Uniswap V4).
 
 import asyncio
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from eth_abi import encode
@@ -11,12 +12,27 @@ from web3 import Web3
 from web3.main import AsyncWeb3
 
 from ..bytecode import POOL_METADATA_BYTECODE
-from ..decoder import decode_metadata_response
+from ..decoder import POOL_METADATA_RESULT_TYPE, decode_metadata_response
 from ..utils import is_valid_metadata
 from .base import PoolFetcher
 
 logger = logging.getLogger(__name__)
 
+# Bytecode decoded to raw bytes once at import so payload construction
+# concatenates bytes and hex-encodes a single time per batch, instead of
+# round-tripping the whole blob through hex strings
+_BYTECODE_BYTES = bytes.fromhex(POOL_METADATA_BYTECODE[2:])
+
+
+@lru_cache(maxsize=256)
+def _encode_address_batch(batch_addresses: tuple) -> bytes:
+    """ABI-encode a batch of addresses, memoized on the address tuple.
+
+    Scanner-style workflows fetch the same pool batches repeatedly, and
+    address-array ABI encoding is pure-Python work worth skipping on repeats.
+    """
+    return encode(["address[]"], [list(batch_addresses)])
+
 
 class DefaultPoolFetcher(PoolFetcher):
     """Handler for regular DEX pools (non-UniswapV4)."""
@@ -24,57 +40,50 @@ class DefaultPoolFetcher(PoolFetcher):
     PROTOCOL_NAME = "default"
     SUPPORTS_TYPE_CHECK = lambda id: Web3.is_address(id)
 
-    async def process_batch(self, batch_addresses: List[str]) -> List[Dict[str, Any]]:
-        """Process a single batch of regular pool addresses."""
-        async with self.batch_semaphore:
-            try:
-                # Encode constructor arguments
-                constructor_args = encode(["address[]"], [batch_addresses])
-                data = POOL_METADATA_BYTECODE + constructor_args.hex().replace("0x", "")
-
-                # Make the call
-                result = await self.make_eth_call(data)
-
-                if not result:
-                    logger.warning(
-                        f"Empty response from eth_call for batch of {len(batch_addresses)} addresses"
-                    )
-                    if self.progress_tracker:
-                        self.progress_tracker.update(len(batch_addresses))
-
-                    # Return placeholder data for each address in the batch
-                    return [
-                        self._create_invalid_pool_metadata(addr)
-                        for addr in batch_addresses
-                    ]
-
-                # Decode the response
-                decoded_pools = decode_metadata_response(result)
-
-                # Mark pools as valid or invalid based on their content and add identifier
-                for pool in decoded_pools:
-                    pool["is_valid"] = is_valid_metadata(pool)
-                    # Set protocol information (empty for default handler as these are generic DEX pools)
-                    pool["protocol"] = ""
-                    # Add unified identifier field
-                    pool["identifier"] = pool["pool_address"]
-
-                # Update progress
-                if self.progress_tracker:
-                    self.progress_tracker.update(len(batch_addresses))
-
-                return decoded_pools
-
-            except Exception as e:
-                logger.error(f"Error processing regular pools batch: {e}")
-                if self.progress_tracker:
-                    self.progress_tracker.update(len(batch_addresses))
-
+    def build_batch_payload(self, batch_addresses: List[str]) -> str:
+        """Build the deployless call payload for a batch of pool addresses."""
+        constructor_args = _encode_address_batch(tuple(batch_addresses))
+        return "0x" + (_BYTECODE_BYTES + constructor_args).hex()
+
+    def decode_batch(
+        self, batch_addresses: List[str], result: bytes
+    ) -> List[Dict[str, Any]]:
+        """Decode the response for a batch of regular pool addresses."""
+        try:
+            if not result:
+                logger.warning(
+                    f"Empty response from eth_call for batch of {len(batch_addresses)} addresses"
+                )
                 # Return placeholder data for each address in the batch
                 return [
-                    self._create_invalid_pool_metadata(addr) for addr in batch_addresses
+                    self._create_invalid_pool_metadata(addr)
+                    for addr in batch_addresses
                 ]
 
+            # Decode the response; passing the expected format skips the
+            # trial-and-error decode across formats
+            decoded_pools = decode_metadata_response(
+                result, expected_type=POOL_METADATA_RESULT_TYPE
+            )
+
+            # Mark pools as valid or invalid based on their content and add identifier
+            for pool in decoded_pools:
+                pool["is_valid"] = is_valid_metadata(pool)
+                # Set protocol information (empty for default handler as these are generic DEX pools)
+                pool["protocol"] = ""
+                # Add unified identifier field
+                pool["identifier"] = pool["pool_address"]
+
+            return decoded_pools
+
+        except Exception as e:
+            logger.error(f"Error processing regular pools batch: {e}")
+
+            # Return placeholder data for each address in the batch
+            return [
+                self._create_invalid_pool_metadata(addr) for addr in batch_addresses
+            ]
+
     def _create_invalid_pool_metadata(self, pool_address: str) -> Dict[str, Any]:
         """Create placeholder metadata for an invalid pool."""
         return {
@@ -11,13 +11,20 @@ from web3 import Web3
 from web3.main import AsyncWeb3
 
 from ..bytecode import UNISWAP_V4_METADATA_BYTECODE
-from ..decoder import decode_metadata_response, register_pool_id
+from ..decoder import (
+    UNISWAP_V4_METADATA_RESULT_TYPE,
+    decode_metadata_response,
+    register_pool_id,
+)
 from ..progress import ProgressTracker
 from ..utils import is_valid_metadata
 from .base import PoolFetcher
 
 logger = logging.getLogger(__name__)
 
+# Bytecode decoded to raw bytes once at import; see default.py for rationale
+_BYTECODE_BYTES = bytes.fromhex(UNISWAP_V4_METADATA_BYTECODE[2:])
+
 # Mapping of chain IDs to Uniswap v4 PositionManager addresses
 # https://docs.uniswap.org/contracts/v4/deployments
 UNISWAP_V4_POSITION_MANAGERS: Dict[int, str] = {
@@ -144,62 +151,52 @@ class UniswapV4PoolFetcher(PoolFetcher):
 
         return results
 
-    async def process_batch(self, batch_pool_ids: List[str]) -> List[Dict[str, Any]]:
-        """Process a single batch of Uniswap V4 pool IDs."""
-        async with self.batch_semaphore:
-            try:
-                # Convert poolIds from hex strings to bytes25
-                bytes25_pool_ids = []
-                for pool_id in batch_pool_ids:
-                    hex_string = pool_id[2:] if pool_id.startswith("0x") else pool_id
-                    pool_id_bytes = bytes.fromhex(hex_string)[:25]
-                    bytes25_pool_ids.append(pool_id_bytes)
-
-                # Encode constructor arguments
-                constructor_args = encode(
-                    ["bytes25[]", "address"],
-                    [bytes25_pool_ids, self.position_manager_address],
-                )
-
-                data = UNISWAP_V4_METADATA_BYTECODE + constructor_args.hex().replace(
-                    "0x", ""
+    def build_batch_payload(self, batch_pool_ids: List[str]) -> str:
+        """Build the deployless call payload for a batch of Uniswap V4 pool IDs."""
+        # Convert poolIds from hex strings to bytes25
+        bytes25_pool_ids = []
+        for pool_id in batch_pool_ids:
+            hex_string = pool_id[2:] if pool_id.startswith("0x") else pool_id
+            pool_id_bytes = bytes.fromhex(hex_string)[:25]
+            bytes25_pool_ids.append(pool_id_bytes)
+
+        # Encode constructor arguments
+        constructor_args = encode(
+            ["bytes25[]", "address"],
+            [bytes25_pool_ids, self.position_manager_address],
+        )
+
+        return "0x" + (_BYTECODE_BYTES + constructor_args).hex()
+
+    def decode_batch(
+        self, batch_pool_ids: List[str], result: bytes
+    ) -> List[Dict[str, Any]]:
+        """Decode the response for a batch of Uniswap V4 pool IDs."""
+        try:
+            if not result:
+                logger.warning(
+                    f"Empty response from eth_call for v4 batch of {len(batch_pool_ids)} pool IDs"
                 )
-
-                # Make the call
-                result = await self.make_eth_call(data)
-
-                if not result:
-                    logger.warning(
-                        f"Empty response from eth_call for v4 batch of {len(batch_pool_ids)} pool IDs"
-                    )
-                    if self.progress_tracker:
-                        self.progress_tracker.update(len(batch_pool_ids))
-
-                    # Return placeholder data for each pool ID in the batch
-                    return [
-                        self._create_invalid_v4_pool_metadata(pid)
-                        for pid in batch_pool_ids
-                    ]
-
-                # Decode the response
-                batch_results = decode_metadata_response(result)
-
-                # Update progress
-                if self.progress_tracker:
-                    self.progress_tracker.update(len(batch_pool_ids))
-
-                return batch_results
-
-            except Exception as e:
-                logger.error(f"Error processing Uniswap v4 pool batch: {e}")
-                if self.progress_tracker:
-                    self.progress_tracker.update(len(batch_pool_ids))
-
                 # Return placeholder data for each pool ID in the batch
                 return [
-                    self._create_invalid_v4_pool_metadata(pid) for pid in batch_pool_ids
+                    self._create_invalid_v4_pool_metadata(pid)
+                    for pid in batch_pool_ids
                 ]
 
+            # Decode the response; passing the expected format skips the
+            # doomed attempt to decode v4 data as regular pool metadata
+            return decode_metadata_response(
+                result, expected_type=UNISWAP_V4_METADATA_RESULT_TYPE
+            )
+
+        except Exception as e:
+            logger.error(f"Error processing Uniswap v4 pool batch: {e}")
+
+            # Return placeholder data for each pool ID in the batch
+            return [
+                self._create_invalid_v4_pool_metadata(pid) for pid in batch_pool_ids
+            ]
+
     def _create_invalid_v4_pool_metadata(self, pool_id: str) -> Dict[str, Any]:
         """Create placeholder metadata for an invalid Uniswap v4 pool."""
         return {
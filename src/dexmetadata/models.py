@@ -3,10 +3,38 @@ Data models for DEX pool metadata.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
+# Column order for the columnar ("columns") output format
+POOL_COLUMNS = [
+    "identifier",
+    "token0_address",
+    "token0_name",
+    "token0_symbol",
+    "token0_decimals",
+    "token1_address",
+    "token1_name",
+    "token1_symbol",
+    "token1_decimals",
+    "protocol",
+    "is_valid",
+]
 
-@dataclass
+
+def pools_to_columns(results: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Convert a list of pool metadata dicts to a dict of columns.
+
+    Bulk consumers (dataframes, analytics) want column vectors rather than
+    one object per pool; a dict of lists feeds pandas/polars/pyarrow
+    constructors directly without an intermediate row iteration.
+    """
+    return {
+        column: [data.get(column) for data in results] for column in POOL_COLUMNS
+    }
+
+
+@dataclass(slots=True)
 class Token:
     address: str
     name: str
@@ -17,7 +45,7 @@ class Token:
         return self.symbol or "Unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class Pool:
     identifier: (
         str  # Unified identifier (address for regular pools, pool_id for Uniswap V4)
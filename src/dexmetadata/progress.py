@@ -32,6 +32,10 @@ class ProgressTracker:
                 BarColumn(),
                 MofNCompleteColumn(),
                 TimeElapsedColumn(),
+                # Default is 10 rerenders/s; 4 is plenty for a fetch bar
+                # and keeps the render thread out of the way of the
+                # event loop on high-throughput runs
+                refresh_per_second=4,
             )
             self.task_id = self.progress.add_task("Fetching", total=total)
 
@@ -7,6 +7,13 @@ from typing import Any, Dict
 
 logger = logging.getLogger(__name__)
 
+# Precomputed per-token metadata keys so validation avoids rebuilding
+# f-string keys on every call (it runs once per pool per fetch).
+_TOKEN_FIELD_KEYS = (
+    ("token0_address", "token0_name", "token0_symbol"),
+    ("token1_address", "token1_name", "token1_symbol"),
+)
+
 
 def is_valid_metadata(metadata: Dict[str, Any]) -> bool:
     """
@@ -33,19 +40,27 @@ def is_valid_metadata(metadata: Dict[str, Any]) -> bool:
         metadata.get("is_uniswap_v4", False) or metadata.get("protocol") == "Uniswap v4"
     )
 
+    # Bind the lookup once; validation is called for every pool fetched
+    get = metadata.get
+
     # Special handling for Uniswap v4 pools
     if is_v4:
         # Just do a basic check that the pool has some token information
-        for token_num in [0, 1]:
-            addr = metadata.get(f"token{token_num}_address", "")
-            name = metadata.get(f"token{token_num}_name", "")
-            symbol = metadata.get(f"token{token_num}_symbol", "")
+        for token_num, (addr_key, name_key, symbol_key) in enumerate(
+            _TOKEN_FIELD_KEYS
+        ):
+            addr = get(addr_key, "")
 
             # For Uniswap v4, either the token has a non-zero address
             # or it has a null address with at least some token info (name or symbol)
-            if not ((addr and addr != zero_addr) or (name or symbol)):
+            if not (
+                (addr and addr != zero_addr)
+                or (get(name_key, "") or get(symbol_key, ""))
+            ):
                 logger.debug(
-                    f"Invalid metadata for Uniswap v4 pool {metadata.get('pool_id', 'unknown')}: token{token_num} has no identity"
+                    "Invalid metadata for Uniswap v4 pool %s: token%s has no identity",
+                    metadata.get("pool_id", "unknown"),
+                    token_num,
                 )
                 return False
 
@@ -53,17 +68,19 @@ def is_valid_metadata(metadata: Dict[str, Any]) -> bool:
         return True
 
     # For non-Uniswap v4 pools, apply the standard validation
-    for token_num in [0, 1]:
-        addr = metadata.get(f"token{token_num}_address", "")
-        name = metadata.get(f"token{token_num}_name", "")
-        symbol = metadata.get(f"token{token_num}_symbol", "")
+    for token_num, (addr_key, name_key, symbol_key) in enumerate(_TOKEN_FIELD_KEYS):
+        addr = get(addr_key, "")
 
         # Regular pools must have a non-zero address
-        has_identity = addr and addr != zero_addr and (name or symbol)
+        has_identity = (
+            addr and addr != zero_addr and (get(name_key, "") or get(symbol_key, ""))
+        )
 
         if not has_identity:
             logger.debug(
-                f"Invalid metadata for pool {metadata.get('pool_address', 'unknown')}: insufficient token{token_num} information"
+                "Invalid metadata for pool %s: insufficient token%s information",
+                metadata.get("pool_address", "unknown"),
+                token_num,
             )
             return False
 
@@ -130,4 +130,17 @@ def test_chain_id_isolation():
     assert len(results1) == 1
     assert len(results8453) == 1
     assert results1["0xabc123"]["chain"] == 1
-    assert results8453["0xabc123"]["chain"] == 8453
\ No newline at end of file
+    assert results8453["0xabc123"]["chain"] == 8453
+
+def test_constructor_rejects_non_positive_limits(tmp_path):
+    """Test that bad size limits fail fast instead of creating a useless cache."""
+    from dexmetadata.cache import PoolMetadataCache
+
+    with pytest.raises(ValueError, match="max_size_mb"):
+        PoolMetadataCache(max_size_mb=0, cache_dir=tmp_path)
+
+    with pytest.raises(ValueError, match="max_size_mb"):
+        PoolMetadataCache(max_size_mb=-5.0, cache_dir=tmp_path)
+
+    with pytest.raises(ValueError, match="max_pools"):
+        PoolMetadataCache(max_pools=0, cache_dir=tmp_path)
@@ -225,4 +225,50 @@ class TestMetadataValidation:
         # If we change the flag to true, the function respects the flag
         # This is the current behavior - is_valid flag takes precedence
         metadata_with_flag["is_valid"] = True
-        assert is_valid_metadata(metadata_with_flag), "The is_valid flag takes precedence over token validation"
\ No newline at end of file
+        assert is_valid_metadata(metadata_with_flag), "The is_valid flag takes precedence over token validation"
+
+def test_pools_to_columns():
+    """
+    Test the columnar (format="columns") conversion of pool metadata.
+
+    Bulk consumers get a dict of column lists; order must follow the
+    input rows and every column must be present even when a row lacks it.
+    """
+    from dexmetadata.models import POOL_COLUMNS, pools_to_columns
+
+    rows = [
+        {
+            "identifier": "0xfBB6Eed8e7aa03B138556eeDaF5D271A5E1e43ef",
+            "token0_address": "0x833589fcd6edb6e08f4c7c32d4f71b54bda02913",
+            "token0_name": "USD Coin",
+            "token0_symbol": "USDC",
+            "token0_decimals": 6,
+            "token1_address": "0xcbb7c0000ab88b473b1f5afd9ef808440eed33bf",
+            "token1_name": "Coinbase Wrapped BTC",
+            "token1_symbol": "cbBTC",
+            "token1_decimals": 8,
+            "protocol": "Uniswap v3",
+            "is_valid": True,
+        },
+        # Invalid placeholder rows carry fewer keys
+        {
+            "identifier": "0x123456789abcdef0123456789abcdef012345678",
+            "is_valid": False,
+        },
+    ]
+
+    columns = pools_to_columns(rows)
+
+    # Every column is present, in the documented order
+    assert list(columns) == POOL_COLUMNS
+
+    # Rows keep their order within each column
+    assert columns["identifier"] == [rows[0]["identifier"], rows[1]["identifier"]]
+    assert columns["token0_symbol"] == ["USDC", None]
+    assert columns["token1_decimals"] == [8, None]
+    assert columns["is_valid"] == [True, False]
+
+    # Empty input still yields the full (empty) column set
+    empty = pools_to_columns([])
+    assert list(empty) == POOL_COLUMNS
+    assert all(column == [] for column in empty.values())
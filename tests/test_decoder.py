@@ -1,6 +1,10 @@
 from eth_abi import encode
 
-from dexmetadata.decoder import decode_metadata_response
+from dexmetadata.decoder import (
+    POOL_METADATA_RESULT_TYPE,
+    UNISWAP_V4_METADATA_RESULT_TYPE,
+    decode_metadata_response,
+)
 
 
 def test_decode_metadata_response_empty():
@@ -136,3 +140,35 @@ def test_decode_uniswap_v4_metadata_native_token():
     assert pool_metadata["token1_name"] == "Ether"
     assert pool_metadata["token1_symbol"] == "ETH"
     assert pool_metadata["token1_decimals"] == 18
+
+
+def test_decode_metadata_response_expected_type():
+    """Test that expected_type restricts decoding to the caller's format."""
+    # Build a Uniswap v4 style payload whose pool ID has non-zero high
+    # bytes, so it cannot be mistaken for an address
+    token0 = ("0x1111111111111111111111111111111111111111", "Token A", "TKA", 18)
+    token1 = ("0x2222222222222222222222222222222222222222", "Token B", "TKB", 6)
+    pool_id_bytes = bytes.fromhex("e6" * 32)
+
+    encoded_data = encode(
+        [UNISWAP_V4_METADATA_RESULT_TYPE],
+        [[(pool_id_bytes, token0, token1)]],
+    )
+
+    # Without a hint the decoder falls through to the v4 format
+    untyped = decode_metadata_response(encoded_data)
+    assert len(untyped) == 1
+    assert untyped[0]["is_uniswap_v4"] is True
+
+    # A caller expecting regular pool metadata never attempts the v4
+    # format, so the same payload yields nothing
+    typed_regular = decode_metadata_response(
+        encoded_data, expected_type=POOL_METADATA_RESULT_TYPE
+    )
+    assert typed_regular == []
+
+    # The matching hint decodes exactly like the untyped path
+    typed_v4 = decode_metadata_response(
+        encoded_data, expected_type=UNISWAP_V4_METADATA_RESULT_TYPE
+    )
+    assert typed_v4 == untyped
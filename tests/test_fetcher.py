@@ -0,0 +1,298 @@
+"""
+Tests for the fetch orchestration layer:
+1. JSON-RPC batch coalescing and its fallbacks in the handler base class
+2. Multi-endpoint striping, order restoration and failover in fetch_async
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from dexmetadata import fetcher
+from dexmetadata.handlers.base import PoolFetcher
+
+
+class FakeBatch:
+    """Stand-in for AsyncWeb3.batch_requests() returning canned responses."""
+
+    def __init__(self, responses):
+        self._responses = responses
+        self.added = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def add(self, call):
+        self.added.append(call)
+
+    async def async_execute(self):
+        return self._responses
+
+
+def resolved_call(result):
+    """Build an eth.call stub returning an already-resolved awaitable."""
+
+    def call(_tx):
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(result)
+        return future
+
+    return call
+
+
+def make_handler(web3):
+    return PoolFetcher(web3, batch_size=30, batch_semaphore=asyncio.Semaphore(5))
+
+
+def test_execute_rpc_batch_coalesces_calls():
+    """Several payloads go out as one JSON-RPC batch, not individual calls."""
+    web3 = MagicMock()
+    web3.batch_requests = lambda: FakeBatch([b"\x01", b"\x02"])
+    web3.eth.call = resolved_call(b"\x09")
+
+    handler = make_handler(web3)
+    responses = asyncio.run(handler.execute_rpc_batch(["0xaa", "0xbb"]))
+
+    # Responses come from the batch, not from individual eth_calls
+    assert responses == [b"\x01", b"\x02"]
+
+
+def test_execute_rpc_batch_falls_back_on_short_response():
+    """A batch response shorter than the request list triggers individual calls."""
+    web3 = MagicMock()
+    # Endpoint silently drops one of the two calls from the batch
+    web3.batch_requests = lambda: FakeBatch([b"\x01"])
+    web3.eth.call = resolved_call(b"\x09")
+
+    handler = make_handler(web3)
+    responses = asyncio.run(handler.execute_rpc_batch(["0xaa", "0xbb"]))
+
+    # Both payloads were retried individually
+    assert responses == [b"\x09", b"\x09"]
+
+
+def test_execute_rpc_batch_without_batch_support():
+    """Providers lacking batch_requests go straight to individual calls."""
+    web3 = MagicMock(spec=["eth"])
+    web3.eth.call = resolved_call(b"\x09")
+
+    handler = make_handler(web3)
+    assert not handler._supports_rpc_batch
+
+    responses = asyncio.run(handler.execute_rpc_batch(["0xaa", "0xbb"]))
+    assert responses == [b"\x09", b"\x09"]
+
+
+class RecordingHandler(PoolFetcher):
+    """Minimal concrete handler for exercising the batch-group plumbing."""
+
+    def build_batch_payload(self, batch_identifiers):
+        if batch_identifiers[0] == "bad":
+            raise ValueError("cannot encode")
+        return "0x" + "".join(batch_identifiers)
+
+    def decode_batch(self, batch_identifiers, result):
+        return [
+            {"identifier": identifier, "raw": result}
+            for identifier in batch_identifiers
+        ]
+
+
+def test_group_concurrency_respects_call_budget():
+    """Coalescing must not raise in-flight eth_calls above the
+    max_concurrent_batches budget the semaphore represents."""
+    for budget, expected_size, expected_groups in [(25, 10, 2), (5, 5, 1), (1, 1, 1)]:
+        handler = PoolFetcher(MagicMock(), 30, asyncio.Semaphore(budget))
+        assert handler._group_size == expected_size
+        assert handler._group_semaphore._value == expected_groups
+        assert handler._group_size * handler._group_semaphore._value <= budget
+
+
+def test_process_batch_group_keeps_alignment_on_encode_failure():
+    """A batch whose payload fails to encode gets an empty response while the
+    rest of the group keeps its batch-to-response alignment."""
+    web3 = MagicMock()
+    web3.batch_requests = lambda: FakeBatch([b"\x01", b"\x02"])
+    web3.eth.call = resolved_call(b"\x09")
+
+    handler = RecordingHandler(web3, 30, asyncio.Semaphore(5))
+    results = asyncio.run(
+        handler.process_batch_group([["aa"], ["bad"], ["bb"]])
+    )
+
+    assert [(r["identifier"], r["raw"]) for r in results] == [
+        ("aa", b"\x01"),
+        ("bad", b""),
+        ("bb", b"\x02"),
+    ]
+
+
+def _row(identifier, valid=True):
+    """Minimal pool metadata dict for multi-RPC tests."""
+    return {"identifier": identifier, "is_valid": valid}
+
+
+def test_multi_rpc_stripes_and_restores_order():
+    """Identifiers are striped round-robin and merged back in input order."""
+    calls = []
+
+    async def fake_run_fetch_async(identifiers, rpc_url, *args, **kwargs):
+        calls.append((rpc_url, tuple(identifiers)))
+        return [_row(identifier) for identifier in identifiers]
+
+    pool_ids = ["0xAA", "0xBB", "0xCC", "0xDD", "0xEE"]
+    with patch.object(fetcher, "run_fetch_async", fake_run_fetch_async):
+        results = asyncio.run(
+            fetcher._run_fetch_multi_rpc(
+                pool_ids, ["u1", "u2"], "base", 8453, 30, 25,
+                "dict", False, 0, None, False,
+            )
+        )
+
+    # Round-robin striping across the two endpoints
+    assert ("u1", ("0xAA", "0xCC", "0xEE")) in calls
+    assert ("u2", ("0xBB", "0xDD")) in calls
+
+    # Output follows the caller's order despite the interleaved fetches
+    assert [r["identifier"] for r in results] == pool_ids
+
+
+def test_multi_rpc_retries_all_invalid_slice_on_next_endpoint():
+    """A slice that comes back entirely invalid (how transport errors
+    surface) is retried once on the next endpoint."""
+    calls = []
+
+    async def fake_run_fetch_async(identifiers, rpc_url, *args, **kwargs):
+        calls.append((rpc_url, tuple(identifiers)))
+        # u1 is dead: everything it returns is an invalid placeholder
+        return [_row(identifier, valid=(rpc_url != "u1")) for identifier in identifiers]
+
+    with patch.object(fetcher, "run_fetch_async", fake_run_fetch_async):
+        results = asyncio.run(
+            fetcher._run_fetch_multi_rpc(
+                ["0xAA", "0xBB", "0xCC"], ["u1", "u2"], "base", 8453, 30, 25,
+                "dict", False, 0, None, False,
+            )
+        )
+
+    # u1's stripe was re-fetched on u2 and the valid retry won
+    assert ("u2", ("0xAA", "0xCC")) in calls
+    assert all(r["is_valid"] for r in results)
+    assert [r["identifier"] for r in results] == ["0xAA", "0xBB", "0xCC"]
+
+
+def test_multi_rpc_failover_with_cache_enabled():
+    """With use_cache=True, sub-fetches must not write the cache, the
+    fallback must bypass cache reads, and the merged results are cached
+    only once the retry decision is made."""
+    calls = []
+
+    async def fake_run_fetch_async(
+        identifiers, rpc_url, network, chain_id, batch_size, show_progress,
+        max_concurrent_batches, format, use_cache, *args, **kwargs,
+    ):
+        calls.append(
+            (rpc_url, tuple(identifiers), use_cache, kwargs.get("cache_writes", True))
+        )
+        # u1 is dead: everything it returns is an invalid placeholder
+        return [_row(identifier, valid=(rpc_url != "u1")) for identifier in identifiers]
+
+    with patch.object(fetcher, "run_fetch_async", fake_run_fetch_async), patch.object(
+        fetcher, "MetadataFetcher"
+    ) as writer_cls:
+        writer = writer_cls.return_value
+        writer._prepare_cache_entries.return_value = {}
+        results = asyncio.run(
+            fetcher._run_fetch_multi_rpc(
+                ["0xAA", "0xBB", "0xCC"], ["u1", "u2"], "base", 8453, 30, 25,
+                "dict", True, 50000, 100.0, True,
+            )
+        )
+
+    # No sub-fetch ever writes the cache itself
+    assert all(cache_writes is False for _, _, _, cache_writes in calls)
+
+    # First attempts read the cache; the retry of u1's stripe bypasses it
+    assert ("u1", ("0xAA", "0xCC"), True, False) in calls
+    assert ("u2", ("0xBB",), True, False) in calls
+    assert ("u2", ("0xAA", "0xCC"), False, False) in calls
+
+    # The merged results are offered to the cache exactly once, after the
+    # failover decision, so only the winning rows are cached
+    writer._prepare_cache_entries.assert_called_once()
+    cached_rows = writer._prepare_cache_entries.call_args[0][0]
+    assert all(row["is_valid"] for row in cached_rows.values())
+    assert all(r["is_valid"] for r in results)
+
+
+def test_multi_rpc_exception_failover():
+    """A slice whose endpoint raises outright is retried on the next one."""
+
+    async def fake_run_fetch_async(identifiers, rpc_url, *args, **kwargs):
+        if rpc_url == "u1":
+            raise ConnectionError("endpoint down")
+        return [_row(identifier) for identifier in identifiers]
+
+    with patch.object(fetcher, "run_fetch_async", fake_run_fetch_async):
+        results = asyncio.run(
+            fetcher._run_fetch_multi_rpc(
+                ["0xAA", "0xBB"], ["u1", "u2"], "base", 8453, 30, 25,
+                "dict", False, 0, None, False,
+            )
+        )
+
+    assert [r["identifier"] for r in results] == ["0xAA", "0xBB"]
+
+
+def test_multi_rpc_columns_format():
+    """format="columns" converts the merged results once, after ordering."""
+
+    async def fake_run_fetch_async(identifiers, rpc_url, *args, **kwargs):
+        return [_row(identifier) for identifier in identifiers]
+
+    with patch.object(fetcher, "run_fetch_async", fake_run_fetch_async):
+        columns = asyncio.run(
+            fetcher._run_fetch_multi_rpc(
+                ["0xAA", "0xBB", "0xCC"], ["u1", "u2"], "base", 8453, 30, 25,
+                "columns", False, 0, None, False,
+            )
+        )
+
+    assert columns["identifier"] == ["0xAA", "0xBB", "0xCC"]
+    assert columns["is_valid"] == [True, True, True]
+
+
+def test_fetch_async_delegates_to_single_endpoint_path():
+    """Without rpc_urls, fetch_async runs the regular single-endpoint fetch."""
+    sentinel = [_row("0xAA")]
+
+    async def fake_run_fetch_async(identifiers, rpc_url, *args, **kwargs):
+        assert rpc_url == "http://rpc.example"
+        return sentinel
+
+    with patch.object(fetcher, "run_fetch_async", fake_run_fetch_async):
+        results = asyncio.run(
+            fetcher.fetch_async(["0xAA"], rpc_url="http://rpc.example")
+        )
+
+    assert results is sentinel
+
+
+def test_fetch_async_routes_rpc_urls_to_multi_endpoint_path():
+    """rpc_urls sends the fetch through the striping path."""
+    sentinel = [_row("0xAA")]
+    seen = {}
+
+    async def fake_multi_rpc(pool_identifiers, rpc_urls, *args, **kwargs):
+        seen["rpc_urls"] = rpc_urls
+        return sentinel
+
+    with patch.object(fetcher, "_run_fetch_multi_rpc", fake_multi_rpc):
+        results = asyncio.run(
+            fetcher.fetch_async(["0xAA"], rpc_urls=["u1", "u2"])
+        )
+
+    assert results is sentinel
+    assert seen["rpc_urls"] == ["u1", "u2"]